@@ -22,7 +22,7 @@ WHERE INSPECTION_LOGS.INSPECTION_ID = classified.INSPECTION_ID;
 -- 2. AI defect classification (notes)
 -----------------------------------------------------------
 
-INSERT INTO INSPECTION_LOGS_ISSUES (INSPECTION_ID, INSPECTOR_NOTES, NOTE_DEFECT, NOTE_SENTIMENT)
+INSERT INTO INSPECTION_LOGS_ISSUES (INSPECTION_ID, INSPECTOR_NOTES, NOTE_DEFECT, NOTE_DEFECT_MASK, NOTE_SENTIMENT)
 SELECT 
     INSPECTION_ID,
     INSPECTOR_NOTES,
@@ -32,6 +32,8 @@ SELECT
         ['crack','mold','leak','exposed_wiring','no damage','termite'],
         {'output_mode': 'multi'}
     ) AS NOTE_DEFECT,
+    -- Bitmask of the labels above (see DEFECT_MASK in table_ddls.sql)
+    DEFECT_MASK(NOTE_DEFECT:labels) AS NOTE_DEFECT_MASK,
     -- Sentiment analysis
     AI_SENTIMENT(INSPECTOR_NOTES):categories[0].sentiment AS NOTE_SENTIMENT
 FROM INSPECTION_LOGS;
@@ -67,7 +69,7 @@ WHERE r.IMAGE_NAME = classified.image_filename;
 -----------------------------------------------------------
 
 
-INSERT INTO IMAGE_ISSUES (IMAGE_PATH, IMAGE_NAME, IMAGE_DEFECT)
+INSERT INTO IMAGE_ISSUES (IMAGE_PATH, IMAGE_NAME, IMAGE_DEFECT, IMAGE_DEFECT_MASK)
 SELECT
    IMAGE_PATH,
    IMAGE_NAME,
@@ -75,6 +77,19 @@ SELECT
      TO_FILE('@RAW_DATA_IMAGES', IMAGE_NAME),
      ['crack','mold','leak','exposed_wiring','no damage','termite'],
      {'output_mode': 'multi'}
-   ) AS IMAGE_DEFECT
+   ) AS IMAGE_DEFECT,
+   DEFECT_MASK(IMAGE_DEFECT:labels) AS IMAGE_DEFECT_MASK
 FROM IMAGE_RAW
 WHERE IMAGE_PATH IS NOT NULL;
+
+-----------------------------------------------------------
+-- 6. Defect bitmask backfill for pre-existing rows (Images & Notes)
+-----------------------------------------------------------
+
+UPDATE IMAGE_ISSUES
+SET IMAGE_DEFECT_MASK = DEFECT_MASK(IMAGE_DEFECT:labels)
+WHERE IMAGE_DEFECT_MASK IS NULL;
+
+UPDATE INSPECTION_LOGS_ISSUES
+SET NOTE_DEFECT_MASK = DEFECT_MASK(NOTE_DEFECT:labels)
+WHERE NOTE_DEFECT_MASK IS NULL;
@@ -0,0 +1,217 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+
+def is_numeric_type(data_type: pa.DataType) -> bool:
+    """Check if an Arrow type should be treated as a numeric (chartable) column."""
+    return (
+        pa.types.is_integer(data_type)
+        or pa.types.is_floating(data_type)
+        or pa.types.is_decimal(data_type)
+    )
+
+
+def build_query_result(table: pa.Table) -> Dict[str, Any]:
+    """
+    Wrap an Arrow table with its column classification.
+    Dtypes are classified once here from the schema, not per consumer.
+    Columns are tracked by position because Snowflake results can repeat
+    a column name (e.g. p.PROPERTY_ID and r.PROPERTY_ID).
+    """
+    numeric_idx = [i for i, f in enumerate(table.schema) if is_numeric_type(f.type)]
+    non_numeric_idx = [i for i, f in enumerate(table.schema) if not is_numeric_type(f.type)]
+    columns = table.column_names
+    return {
+        "table": table,
+        "num_rows": table.num_rows,
+        "columns": columns,
+        "numeric_idx": numeric_idx,
+        "non_numeric_idx": non_numeric_idx,
+        "numeric_cols": [columns[i] for i in numeric_idx],
+        "non_numeric_cols": [columns[i] for i in non_numeric_idx],
+    }
+
+
+def fetch_query_result(session: Any, sql_query: str) -> Dict[str, Any]:
+    """Run a query and fetch the result as Arrow, without going through pandas."""
+    cursor = session.connection.cursor()
+    try:
+        cursor.execute(sql_query)
+        table = cursor.fetch_arrow_all()
+        if table is None:
+            # The connector returns None instead of an empty table when no rows match
+            table = pa.table({
+                col.name: pa.array([], type=pa.null()) for col in cursor.description
+            })
+    finally:
+        cursor.close()
+    return build_query_result(table)
+
+
+def unique_names(names: List[str]) -> List[str]:
+    """Suffix repeated column names (ID, ID -> ID, ID_2) so they can be addressed by name."""
+    seen: Dict[str, int] = {}
+    unique = []
+    for name in names:
+        seen[name] = seen.get(name, 0) + 1
+        unique.append(name if seen[name] == 1 else f"{name}_{seen[name]}")
+    return unique
+
+
+def chart_table(result: Dict[str, Any]) -> Tuple[pa.Table, Optional[str], List[str]]:
+    """
+    Project the columns needed for charts and return (table, x column, y columns).
+    Table.select and rename_columns only re-reference existing column buffers,
+    so no data is copied. The x column is None when there is no label column.
+    """
+    table = result["table"]
+    x_idx = result["non_numeric_idx"][:1]
+    projection = table.select(x_idx + result["numeric_idx"])
+    projection = projection.rename_columns(unique_names(projection.column_names))
+
+    names = projection.column_names
+    if x_idx:
+        return projection, names[0], names[1:]
+    return projection, None, names
+
+
+def head_as_pandas(result: Dict[str, Any], max_rows: int) -> pd.DataFrame:
+    """Convert only the first max_rows rows to pandas (for text rendering)."""
+    return result["table"].slice(0, max_rows).to_pandas()
+
+
+def iter_rows(result: Dict[str, Any], chunk_size: int = 64) -> Iterator[Tuple[Any, ...]]:
+    """
+    Lazily yield rows as tuples, in column order.
+    Only one chunk of chunk_size rows is converted to Python objects at a time.
+    """
+    for batch in result["table"].to_batches(max_chunksize=chunk_size):
+        yield from zip(*(column.to_pylist() for column in batch.columns))
+
+
+def _benchmark(
+    num_rows: int = 500_000,
+    num_numeric: int = 40,
+    num_text: int = 10,
+    chart_rows: int = 20_000,
+) -> Dict[str, Any]:
+    """
+    Compare the old pandas display path with the Arrow path on a wide result.
+    Each path runs in a fresh process and calls the real st.dataframe/st.bar_chart
+    (bare mode, no server). Peak memory is the highest sampled current RSS above
+    the level right after the fetched table was built.
+
+    The chart phase uses only the first chart_rows rows for both paths: Altair
+    melts every numeric column into long form, which does not finish at full size.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    ctx = multiprocessing.get_context("spawn")
+    report = {"rows": num_rows, "columns": num_numeric + num_text, "chart_rows": chart_rows}
+    for path in ("pandas", "arrow"):
+        with ProcessPoolExecutor(1, mp_context=ctx) as pool:
+            report[path] = pool.submit(
+                _run_path, path, num_rows, num_numeric, num_text, chart_rows
+            ).result()
+    return report
+
+
+class _RssSampler:
+    """Background thread tracking the peak of current RSS (not the lifetime ru_maxrss)."""
+
+    def __init__(self, interval: float = 0.001):
+        import os
+        import threading
+
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.baseline = self.current()
+        self.peak = self.baseline
+
+    def current(self) -> int:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * self._page_size
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            self._stop.wait(self._interval)
+
+    def __enter__(self) -> "_RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+    @property
+    def peak_mb(self) -> float:
+        return round((self.peak - self.baseline) / 2**20, 1)
+
+
+def _run_path(
+    path: str, num_rows: int, num_numeric: int, num_text: int, chart_rows: int
+) -> Dict[str, float]:
+    """Time and measure one display path, from fetched Arrow table to Streamlit protos."""
+    import gc
+    import logging
+    import time
+    import warnings
+
+    import numpy as np
+    import streamlit as st
+
+    # Bare mode warns about the missing ScriptRunContext on every element
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+    rng = np.random.default_rng(0)
+    columns = {f"ROOM_{i}": pa.array(rng.integers(0, 5, num_rows).astype(str)) for i in range(num_text)}
+    columns.update({f"SCORE_{i}": pa.array(rng.random(num_rows)) for i in range(num_numeric)})
+    fetched = pa.table(columns)
+    gc.collect()
+
+    # Phase 1: fetch result -> data tab (time to first render)
+    with _RssSampler() as table_mem:
+        start = time.perf_counter()
+        if path == "pandas":
+            df = fetched.to_pandas()
+            # should_show_charts classified dtypes before rendering
+            df.select_dtypes(include=["number"]).columns.tolist()
+            df.select_dtypes(exclude=["number"]).columns.tolist()
+            st.dataframe(df)
+        else:
+            result = build_query_result(fetched)
+            st.dataframe(result["table"])
+        first_render = time.perf_counter() - start
+
+    # Phase 2: chart tab (Streamlit converts chart input to pandas either way)
+    with _RssSampler() as chart_mem:
+        start = time.perf_counter()
+        if path == "pandas":
+            head = df.head(chart_rows)
+            numeric_cols = head.select_dtypes(include=["number"]).columns.tolist()
+            non_numeric_cols = head.select_dtypes(exclude=["number"]).columns.tolist()
+            chart_df = head.set_index(non_numeric_cols[0])[numeric_cols]
+            st.bar_chart(chart_df)
+        else:
+            chart_data, x_col, y_cols = chart_table(build_query_result(result["table"].slice(0, chart_rows)))
+            st.bar_chart(chart_data, x=x_col, y=y_cols)
+        chart_seconds = time.perf_counter() - start
+
+    return {
+        "first_render_seconds": round(first_render, 3),
+        "first_render_peak_mb": table_mem.peak_mb,
+        "chart_seconds": round(chart_seconds, 3),
+        "chart_peak_mb": chart_mem.peak_mb,
+    }
+
+
+if __name__ == "__main__":
+    print(_benchmark())
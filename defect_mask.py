@@ -0,0 +1,122 @@
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+# AI_CLASSIFY label set, in bit order (bit i <-> DEFECT_LABELS[i]).
+# Must stay in sync with DEFECT_MASK() in table_ddls.sql.
+DEFECT_LABELS = ("crack", "mold", "leak", "exposed_wiring", "no damage", "termite")
+DEFECT_BITS = {label: 1 << i for i, label in enumerate(DEFECT_LABELS)}
+
+# Severity weights; must match DEFECT_MASK_SEVERITY() in table_ddls.sql
+# (checked by test_defect_mask.py).
+DEFECT_SEVERITY = {
+    "exposed_wiring": 5,
+    "leak": 4,
+    "crack": 3,
+    "termite": 4,
+    "mold": 2,
+    "no damage": 0,
+}
+
+MASK_LIMIT = 1 << len(DEFECT_LABELS)
+
+
+def _build_severity_table() -> np.ndarray:
+    """Precompute the weighted popcount of every possible mask."""
+    table = np.zeros(MASK_LIMIT, dtype=np.int16)
+    for label, bit in DEFECT_BITS.items():
+        table[(np.arange(MASK_LIMIT) & bit) != 0] += DEFECT_SEVERITY[label]
+    return table
+
+
+SEVERITY_TABLE = _build_severity_table()
+
+
+def encode_labels(labels: Iterable[str]) -> int:
+    """Encode AI_CLASSIFY labels as a defect bitmask (unknown labels are ignored)."""
+    mask = 0
+    for label in labels or []:
+        mask |= DEFECT_BITS.get(str(label).lower().strip(), 0)
+    return mask
+
+
+def decode_mask(mask: int) -> List[str]:
+    """Return the labels whose bits are set in mask, in bit order."""
+    return [label for label, bit in DEFECT_BITS.items() if int(mask) & bit]
+
+
+def score_masks(masks: Sequence[int]) -> np.ndarray:
+    """Vectorized severity score for an array of defect masks."""
+    masks = np.asarray(masks, dtype=np.int64)
+    if masks.size and (masks.min() < 0 or masks.max() >= MASK_LIMIT):
+        raise ValueError(f"Defect masks must be in [0, {MASK_LIMIT}), got {masks.min()}..{masks.max()}")
+    return SEVERITY_TABLE[masks]
+
+
+def room_severity_scores(
+    df: pd.DataFrame,
+    keys: Sequence[str] = ("PROPERTY_ID", "ROOM_NAME"),
+    mask_col: str = "DEFECT_MASK",
+) -> pd.DataFrame:
+    """
+    OR the defect masks of every issue row per room, then score each room.
+    Mirrors the room_masks/raw_scores steps of ROOM_RISK_SCORE_DT.
+    """
+    keys = list(keys)
+    masks = df[mask_col]
+    valid = masks.notna().to_numpy()
+    df = df.loc[valid, keys]
+    masks = masks.to_numpy()[valid].astype(np.int64)
+
+    # ngroup(sort=False) numbers rooms in order of first appearance, matching drop_duplicates.
+    group_ids = df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    result = df.drop_duplicates(keys).reset_index(drop=True)
+    room_masks = np.zeros(len(result), dtype=np.int64)
+    np.bitwise_or.at(room_masks, group_ids, masks)
+    result[mask_col] = room_masks
+    result = result[result[mask_col] != 0].reset_index(drop=True)
+    result["RAW_SEVERITY_SCORE"] = score_masks(result[mask_col].to_numpy())
+    return result
+
+
+def _benchmark(num_rows: int = 2_000_000, num_rooms: int = 200_000) -> Dict[str, float]:
+    """Time mask scoring against the old flatten/dedupe/join shape (parity is in test_defect_mask.py)."""
+    import time
+
+    rng = np.random.default_rng(0)
+    room_ids = rng.integers(0, num_rooms, num_rows)
+    df = pd.DataFrame({
+        "PROPERTY_ID": room_ids // 5,
+        "ROOM_NAME": room_ids % 5,
+        "DEFECT_MASK": rng.integers(0, MASK_LIMIT, num_rows),
+    })
+
+    start = time.perf_counter()
+    scores = room_severity_scores(df)
+    mask_seconds = time.perf_counter() - start
+
+    # Baseline: the flatten + dedupe + weight-join shape of the old SQL.
+    start = time.perf_counter()
+    flat = df.loc[df.index.repeat(len(DEFECT_LABELS)), ["PROPERTY_ID", "ROOM_NAME"]]
+    bits = np.tile(np.arange(len(DEFECT_LABELS)), num_rows)
+    is_set = (np.repeat(df["DEFECT_MASK"].to_numpy(), len(DEFECT_LABELS)) >> bits) & 1 == 1
+    flat = flat[is_set].assign(DEFECT=np.array(DEFECT_LABELS, dtype=object)[bits[is_set]])
+    weights = pd.DataFrame(list(DEFECT_SEVERITY.items()), columns=["DEFECT", "SEVERITY"])
+    (
+        flat.drop_duplicates()
+        .merge(weights, on="DEFECT")
+        .groupby(["PROPERTY_ID", "ROOM_NAME"], dropna=False)["SEVERITY"].sum()
+    )
+    flatten_seconds = time.perf_counter() - start
+
+    return {
+        "rows": num_rows,
+        "rooms": len(scores),
+        "mask_seconds": mask_seconds,
+        "flatten_seconds": flatten_seconds,
+    }
+
+
+if __name__ == "__main__":
+    print(_benchmark())
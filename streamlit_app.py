@@ -8,6 +8,8 @@ import streamlit as st
 import _snowflake
 from snowflake.snowpark.context import get_active_session
 
+from arrow_results import chart_table, fetch_query_result, head_as_pandas, iter_rows
+
 DATABASE = "AI_FOR_GOOD"
 SCHEMA = "AI_HOME_INSPECTION"
 SEMANTIC_VIEW = "AI_FOR_GOOD.AI_HOME_INSPECTION.AI_HOME_INSPECTION"
@@ -251,16 +253,17 @@ def create_metric_card(label: str, value: str , colors: dict=None) -> str:
         </div>
         """
 
-def display_single_value_metrics(df: pd.DataFrame):
+def display_single_value_metrics(result: Dict[str, Any]):
     """Display single row results as attractive metric cards."""
-    num_cols = min(len(df.columns), 4)
+    table = result["table"]
+    num_cols = min(len(result["columns"]), 4)
     cols = st.columns(num_cols)
     
-    for idx, col_name in enumerate(df.columns):
-        value = df[col_name].iloc[0]
+    for idx, col_name in enumerate(result["columns"]):
+        value = table.column(idx)[0].as_py()
         with cols[idx % num_cols]:
             # Format value based on type
-            if pd.api.types.is_numeric_dtype(df[col_name]):
+            if idx in result["numeric_idx"] and value is not None:
                 if isinstance(value, float):
                     display_value = f"{value:,.2f}"
                 else:
@@ -279,7 +282,7 @@ def display_single_value_metrics(df: pd.DataFrame):
             ), unsafe_allow_html=True)
 
 
-def should_show_charts(df: pd.DataFrame) -> dict:
+def should_show_charts(result: Dict[str, Any]) -> dict:
     """
     Intelligently determine if charts should be shown based on data characteristics.
     Returns a dict with chart recommendations.
@@ -290,9 +293,10 @@ def should_show_charts(df: pd.DataFrame) -> dict:
         "reason": ""
     }
     
-    num_rows = len(df)
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-    non_numeric_cols = df.select_dtypes(exclude=['number']).columns.tolist()
+    num_rows = result["num_rows"]
+    columns = result["columns"]
+    numeric_cols = result["numeric_cols"]
+    non_numeric_cols = result["non_numeric_cols"]
     
     # Don't show charts for single value results
     if num_rows == 1 and len(numeric_cols) <= 2:
@@ -305,7 +309,7 @@ def should_show_charts(df: pd.DataFrame) -> dict:
         return recommendations
     
     # Don't show charts for image-only results
-    if IMAGE_COLUMN_NAME.upper() in [c.upper() for c in df.columns] and len(df.columns) <= 3:
+    if IMAGE_COLUMN_NAME.upper() in [c.upper() for c in columns] and len(columns) <= 3:
         recommendations["reason"] = "Image gallery result"
         return recommendations
     
@@ -315,7 +319,7 @@ def should_show_charts(df: pd.DataFrame) -> dict:
     
     # Show line chart for time series or many data points
     if num_rows > 5:
-        first_col = df.columns[0].lower()
+        first_col = columns[0].lower()
         time_indicators = ['date', 'time', 'month', 'year', 'day', 'week', 'quarter']
         if any(indicator in first_col for indicator in time_indicators):
             recommendations["show_line"] = True
@@ -325,16 +329,16 @@ def should_show_charts(df: pd.DataFrame) -> dict:
     return recommendations
 
 
-def generate_data_insights(df: pd.DataFrame, user_question: str) -> str:
+def generate_data_insights(result: Dict[str, Any], user_question: str) -> str:
     """Generate natural language insights using Cortex LLM."""
     try:
         max_rows = 50
-        if len(df) > max_rows:
-            data_string = df.head(max_rows).to_string(index=False)
-            data_note = f"(Showing first {max_rows} of {len(df)} rows)"
+        num_rows = result["num_rows"]
+        data_string = head_as_pandas(result, max_rows).to_string(index=False)
+        if num_rows > max_rows:
+            data_note = f"(Showing first {max_rows} of {num_rows} rows)"
         else:
-            data_string = df.to_string(index=False)
-            data_note = f"(Total: {len(df)} rows)"
+            data_note = f"(Total: {num_rows} rows)"
         
         prompt = f"""You are a data analyst assistant for a home inspection system. 
 Analyze the following query results and provide a clear, concise summary with key insights.
@@ -371,32 +375,32 @@ Keep the response concise, professional, and actionable. Format with markdown fo
         return f"Error generating insights: {str(e)}"
 
 
-def get_image_column(df: pd.DataFrame) -> Optional[str]:
-    """Get the IMAGE_NAME column if it exists."""
-    for col in df.columns:
+def get_image_column(result: Dict[str, Any]) -> Optional[int]:
+    """Get the position of the IMAGE_NAME column if it exists."""
+    for idx, col in enumerate(result["columns"]):
         if col.upper() == IMAGE_COLUMN_NAME.upper():
-            return col
+            return idx
     return None
 
 
-def display_images_from_dataframe(df: pd.DataFrame) -> bool:
+def display_images_from_result(result: Dict[str, Any]) -> bool:
     """Display images in an attractive gallery layout."""
-    image_column = get_image_column(df)
+    image_column = get_image_column(result)
     
-    if not image_column:
+    if image_column is None:
         return False
     
     images_to_display = []
     
-    for _, row in df.iterrows():
-        image_name = row.get(image_column)
+    for row in iter_rows(result):
+        image_name = row[image_column]
         if pd.notna(image_name) and image_name:
             image_path = os.path.join(IMAGE_FOLDER, str(image_name))
             
             caption_parts = []
-            for col in df.columns:
-                if col != image_column and pd.notna(row.get(col)):
-                    caption_parts.append(f"**{col.replace('_', ' ').title()}:** {row[col]}")
+            for idx, col in enumerate(result["columns"]):
+                if idx != image_column and pd.notna(row[idx]):
+                    caption_parts.append(f"**{col.replace('_', ' ').title()}:** {row[idx]}")
             
             images_to_display.append({
                 "path": image_path,
@@ -520,17 +524,18 @@ def display_content(
 
             with st.spinner("Executing query..."):
                 try:
-                    df = session.sql(sql_query).to_pandas()
+                    result = fetch_query_result(session, sql_query)
                 except Exception as e:
                     st.error(f"Query Error: {str(e)}")
                     return
 
-                if df.empty:
+                if result["num_rows"] == 0:
                     st.info("No data found for your query.")
                     return
 
-                num_rows = len(df)
-                chart_recs = should_show_charts(df)
+                num_rows = result["num_rows"]
+                table = result["table"]
+                chart_recs = should_show_charts(result)
                 
                 # Single value result - show as metrics
                 if num_rows == 1:
@@ -540,11 +545,11 @@ def display_content(
                         </div>
                         """, unsafe_allow_html=True)
                     #st.markdown("### 📋 Query Results")
-                    display_single_value_metrics(df)
+                    display_single_value_metrics(result)
                     
                     # Also show raw data in expander
                     with st.expander("View Raw Data", expanded=False):
-                        st.dataframe(df, use_container_width=True)
+                        st.dataframe(table, use_container_width=True)
                 
                 # Multiple rows - show table and optional charts
                 else:
@@ -563,7 +568,7 @@ def display_content(
                             </div>
                             """, unsafe_allow_html=True)
                         #st.markdown("### 📋 Query Results")
-                        st.dataframe(df, use_container_width=True)
+                        st.dataframe(table, use_container_width=True)
                     else:
                         st.markdown("""
                                 <div class="insight-card">
@@ -573,30 +578,23 @@ def display_content(
                         tabs = st.tabs(tab_names)
                         
                         with tabs[0]:  # Data tab
-                            st.dataframe(df, use_container_width=True)
+                            st.dataframe(table, use_container_width=True)
                         
                         # Chart data
-                        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-                        non_numeric_cols = df.select_dtypes(exclude=['number']).columns.tolist()
-                        
-                        if numeric_cols:
+                        if result["numeric_idx"]:
                             try:
-                                if non_numeric_cols:
-                                    index_col = non_numeric_cols[0]
-                                    chart_df = df.set_index(index_col)[numeric_cols]
-                                else:
-                                    chart_df = df[numeric_cols].copy()
-                                    chart_df.index = [f"Item {i+1}" for i in range(len(chart_df))]
+                                # Zero-copy projection; x_col is None when there is no label column
+                                chart_data, x_col, y_cols = chart_table(result)
                                 
                                 tab_idx = 1
                                 if chart_recs["show_bar"] and tab_idx < len(tabs):
                                     with tabs[tab_idx]:
-                                        st.bar_chart(chart_df)
+                                        st.bar_chart(chart_data, x=x_col, y=y_cols)
                                     tab_idx += 1
                                 
                                 if chart_recs["show_line"] and tab_idx < len(tabs):
                                     with tabs[tab_idx]:
-                                        st.line_chart(chart_df)
+                                        st.line_chart(chart_data, x=x_col, y=y_cols)
                             except Exception as chart_error:
                                 st.caption(f"Chart unavailable: {chart_error}")
 
@@ -605,11 +603,11 @@ def display_content(
                 user_question = st.session_state.get("current_question", "Analyze this data")
                 
                 with st.spinner("Generating insights..."):
-                    insights = generate_data_insights(df, user_question)
+                    insights = generate_data_insights(result, user_question)
                     st.markdown(insights)
 
                 # Display images if present
-                display_images_from_dataframe(df)
+                display_images_from_result(result)
 
     # Request ID in footer (collapsed by default)
     if request_id:
@@ -58,7 +58,8 @@ create or replace TABLE AI_FOR_GOOD.AI_HOME_INSPECTION.INSPECTION_LOGS_ISSUES (
 	INSPECTION_ID NUMBER(38,0),
 	INSPECTOR_NOTES VARCHAR(16777216),
 	NOTE_SENTIMENT VARCHAR(16777216),
-	NOTE_DEFECT VARIANT
+	NOTE_DEFECT VARIANT,
+	NOTE_DEFECT_MASK NUMBER(3,0)
 )COMMENT='Sentiment & Classification Detection of Inspection notes'
 ;
 
@@ -76,10 +77,41 @@ create or replace TABLE AI_FOR_GOOD.AI_HOME_INSPECTION.IMAGE_RAW (
 create or replace TABLE AI_FOR_GOOD.AI_HOME_INSPECTION.IMAGE_ISSUES (
 	IMAGE_PATH VARCHAR(16777216),
 	IMAGE_NAME VARCHAR(16777216),
-	IMAGE_DEFECT VARIANT
+	IMAGE_DEFECT VARIANT,
+	IMAGE_DEFECT_MASK NUMBER(3,0)
 );
 
 
+-- 6A. Defect bitmask helpers
+-- One bit per AI_CLASSIFY label (see defect_mask.py for the Python codec):
+-- crack=1, mold=2, leak=4, exposed_wiring=8, no damage=16, termite=32
+-- Labels are matched case-insensitively, like the old LOWER() join.
+CREATE OR REPLACE FUNCTION DEFECT_MASK(labels VARIANT)
+    RETURNS NUMBER(3,0)
+    COMMENT = 'Encodes an AI_CLASSIFY labels array as a 6-bit defect mask.'
+AS
+$$
+    IFF(ARRAY_CONTAINS('crack'::VARIANT, TRANSFORM(labels::ARRAY, x -> TRIM(LOWER(x::STRING))::VARIANT)), 1, 0)
+  + IFF(ARRAY_CONTAINS('mold'::VARIANT, TRANSFORM(labels::ARRAY, x -> TRIM(LOWER(x::STRING))::VARIANT)), 2, 0)
+  + IFF(ARRAY_CONTAINS('leak'::VARIANT, TRANSFORM(labels::ARRAY, x -> TRIM(LOWER(x::STRING))::VARIANT)), 4, 0)
+  + IFF(ARRAY_CONTAINS('exposed_wiring'::VARIANT, TRANSFORM(labels::ARRAY, x -> TRIM(LOWER(x::STRING))::VARIANT)), 8, 0)
+  + IFF(ARRAY_CONTAINS('no damage'::VARIANT, TRANSFORM(labels::ARRAY, x -> TRIM(LOWER(x::STRING))::VARIANT)), 16, 0)
+  + IFF(ARRAY_CONTAINS('termite'::VARIANT, TRANSFORM(labels::ARRAY, x -> TRIM(LOWER(x::STRING))::VARIANT)), 32, 0)
+$$;
+
+CREATE OR REPLACE FUNCTION DEFECT_MASK_SEVERITY(mask NUMBER)
+    RETURNS NUMBER(3,0)
+    COMMENT = 'Sums the severity weights of every defect bit set in a mask.'
+AS
+$$
+    IFF(BITAND(mask, 1) <> 0, 3, 0)   -- crack
+  + IFF(BITAND(mask, 2) <> 0, 2, 0)   -- mold
+  + IFF(BITAND(mask, 4) <> 0, 4, 0)   -- leak
+  + IFF(BITAND(mask, 8) <> 0, 5, 0)   -- exposed_wiring
+  + IFF(BITAND(mask, 32) <> 0, 4, 0)  -- termite ('no damage' weighs 0)
+$$;
+
+
 
 
 -- 7A. Streams
@@ -113,9 +145,11 @@ AS
     ON target.IMAGE_NAME = source.IMAGE_NAME
     WHEN MATCHED THEN UPDATE SET 
         target.IMAGE_PATH = source.IMAGE_PATH,
-        target.IMAGE_DEFECT = source.IMAGE_DEFECT
-    WHEN NOT MATCHED THEN INSERT (IMAGE_NAME, IMAGE_PATH, IMAGE_DEFECT)
-        VALUES (source.IMAGE_NAME, source.IMAGE_PATH, source.IMAGE_DEFECT);
+        target.IMAGE_DEFECT = source.IMAGE_DEFECT,
+        target.IMAGE_DEFECT_MASK = DEFECT_MASK(source.IMAGE_DEFECT:labels)
+    WHEN NOT MATCHED THEN INSERT (IMAGE_NAME, IMAGE_PATH, IMAGE_DEFECT, IMAGE_DEFECT_MASK)
+        VALUES (source.IMAGE_NAME, source.IMAGE_PATH, source.IMAGE_DEFECT,
+                DEFECT_MASK(source.IMAGE_DEFECT:labels));
 
 --SUSPEND TASK_PROCESS_IMAGES
 ALTER TASK IF EXISTS TASK_PROCESS_IMAGES SUSPEND;
@@ -137,11 +171,13 @@ AS
     WHEN MATCHED THEN UPDATE SET 
         target.INSPECTOR_NOTES = source.INSPECTOR_NOTES,
         target.NOTE_DEFECT = source.NOTE_DEFECT,
+        target.NOTE_DEFECT_MASK = DEFECT_MASK(source.NOTE_DEFECT:labels),
         target.NOTE_SENTIMENT = source.NOTE_SENTIMENT
     WHEN NOT MATCHED THEN INSERT 
-        (INSPECTION_ID, INSPECTOR_NOTES, NOTE_DEFECT, NOTE_SENTIMENT)
+        (INSPECTION_ID, INSPECTOR_NOTES, NOTE_DEFECT, NOTE_DEFECT_MASK, NOTE_SENTIMENT)
         VALUES (source.INSPECTION_ID, source.INSPECTOR_NOTES, 
-                source.NOTE_DEFECT, source.NOTE_SENTIMENT);
+                source.NOTE_DEFECT, DEFECT_MASK(source.NOTE_DEFECT:labels),
+                source.NOTE_SENTIMENT);
 
 
 
@@ -154,53 +190,47 @@ CREATE OR REPLACE DYNAMIC TABLE ROOM_RISK_SCORE_DT
     COMMENT = 'Calculates normalized risk scores per room type for each property.'
 AS
 WITH 
--- Extract all defects from images
+-- Defect masks from images
 image_defects AS (
   SELECT
     ir.property_id,
     ir.room_name,
-    d.value::string AS defect
+    i.image_defect_mask AS defect_mask
   FROM image_issues i
   JOIN image_raw ir
     ON i.image_name = ir.image_name
-  , LATERAL FLATTEN(input => i.image_defect:labels) d
 ),
--- Extract all defects from inspection notes
+-- Defect masks from inspection notes
 note_defects AS (
   SELECT
     il.property_id,
     il.room_name,
-    n.value::string AS defect
+    ili.note_defect_mask AS defect_mask
   FROM inspection_logs_issues ili
   JOIN inspection_logs il
     ON ili.inspection_id = il.inspection_id
-  , LATERAL FLATTEN(input => ili.note_defect:labels) n
-),
--- Combine defects from both sources, removing duplicates
-all_defects AS (
-  SELECT * FROM image_defects
-  UNION 
-  SELECT * FROM note_defects
 ),
--- Define severity weights for each defect type
-defect_weights AS (
-  SELECT 'exposed_wiring' AS defect, 5 AS severity
-  UNION ALL SELECT 'leak', 4
-  UNION ALL SELECT 'crack', 3
-  UNION ALL SELECT 'termite', 4
-  UNION ALL SELECT 'mold', 2
-  UNION ALL SELECT 'no damage', 0
+-- OR the masks from both sources, so each defect counts once per room
+room_masks AS (
+  SELECT
+    property_id,
+    room_name,
+    BITOR_AGG(defect_mask) AS defect_mask
+  FROM (
+    SELECT * FROM image_defects
+    UNION ALL
+    SELECT * FROM note_defects
+  )
+  GROUP BY property_id, room_name
+  HAVING BITOR_AGG(defect_mask) <> 0
 ),
--- Calculate raw severity scores
+-- Calculate raw severity scores from the set bits
 raw_scores AS (
   SELECT
-    a.property_id,
-    a.room_name,
-    SUM(w.severity) AS raw_severity_score
-  FROM all_defects a
-  JOIN defect_weights w
-    ON LOWER(a.defect) = LOWER(w.defect)
-  GROUP BY a.property_id, a.room_name
+    property_id,
+    room_name,
+    DEFECT_MASK_SEVERITY(defect_mask) AS raw_severity_score
+  FROM room_masks
 )
 -- Final output with normalized scores
 SELECT
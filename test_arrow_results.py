@@ -0,0 +1,123 @@
+from decimal import Decimal
+
+import pyarrow as pa
+
+from arrow_results import (
+    build_query_result,
+    chart_table,
+    fetch_query_result,
+    head_as_pandas,
+    iter_rows,
+)
+
+
+def _sample_table() -> pa.Table:
+    return pa.table({
+        "PROPERTY_ID": ["P1", "P2", "P3"],
+        "ROOM_COUNT": pa.array([1, 2, 3], type=pa.int64()),
+        "SCORE": [1.5, 2.5, 3.5],
+        "SEVERITY": pa.array([Decimal("1.20"), Decimal("3.40"), None], type=pa.decimal128(10, 2)),
+        "IS_FLAGGED": [True, False, True],
+    })
+
+
+class _FakeCursor:
+    def __init__(self, table, column_names):
+        self._table = table
+        self.description = [type("Column", (), {"name": name})() for name in column_names]
+        self.closed = False
+
+    def execute(self, sql_query):
+        return self
+
+    def fetch_arrow_all(self):
+        return self._table
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeSession:
+    def __init__(self, cursor):
+        self.connection = type("Connection", (), {"cursor": lambda _self: cursor})()
+
+
+def test_classifies_columns_from_schema():
+    result = build_query_result(_sample_table())
+    assert result["num_rows"] == 3
+    assert result["numeric_idx"] == [1, 2, 3]
+    assert result["non_numeric_idx"] == [0, 4]
+    assert result["numeric_cols"] == ["ROOM_COUNT", "SCORE", "SEVERITY"]
+    # bool is not chartable as a measure, matching pandas select_dtypes(include=['number'])
+    assert result["non_numeric_cols"] == ["PROPERTY_ID", "IS_FLAGGED"]
+
+
+def test_chart_table_with_label_column_shares_buffers():
+    table = _sample_table()
+    chart_data, x_col, y_cols = chart_table(build_query_result(table))
+
+    assert x_col == "PROPERTY_ID"
+    assert y_cols == ["ROOM_COUNT", "SCORE", "SEVERITY"]
+    assert chart_data.column_names == ["PROPERTY_ID", "ROOM_COUNT", "SCORE", "SEVERITY"]
+    for name in chart_data.column_names:
+        source = table.column(name).chunk(0).buffers()
+        projected = chart_data.column(name).chunk(0).buffers()
+        assert [b.address for b in projected if b] == [b.address for b in source if b]
+
+
+def test_chart_table_without_label_column():
+    table = _sample_table().select(["ROOM_COUNT", "SCORE"])
+    chart_data, x_col, y_cols = chart_table(build_query_result(table))
+
+    assert x_col is None
+    assert y_cols == ["ROOM_COUNT", "SCORE"]
+    assert chart_data.column_names == ["ROOM_COUNT", "SCORE"]
+
+
+def test_head_as_pandas_only_converts_head():
+    df = head_as_pandas(build_query_result(_sample_table()), 2)
+    assert df["PROPERTY_ID"].tolist() == ["P1", "P2"]
+
+
+def test_iter_rows_is_chunked_and_positional():
+    rows = iter_rows(build_query_result(_sample_table()), chunk_size=1)
+    assert next(rows) == ("P1", 1, 1.5, Decimal("1.20"), True)
+    assert [row[0] for row in rows] == ["P2", "P3"]
+
+
+def test_duplicate_column_names():
+    # e.g. SELECT p.PROPERTY_ID, r.PROPERTY_ID, r.SCORE, r.SCORE ...
+    table = pa.Table.from_arrays(
+        [pa.array(["P1", "P2"]), pa.array(["P1", "P9"]), pa.array([1.0, 2.0]), pa.array([3, 4])],
+        names=["PROPERTY_ID", "PROPERTY_ID", "SCORE", "SCORE"],
+    )
+    result = build_query_result(table)
+    assert result["numeric_idx"] == [2, 3]
+    assert result["non_numeric_idx"] == [0, 1]
+
+    chart_data, x_col, y_cols = chart_table(result)
+    assert x_col == "PROPERTY_ID"
+    assert y_cols == ["SCORE", "SCORE_2"]
+    assert chart_data.column("SCORE_2").to_pylist() == [3, 4]
+
+    assert list(iter_rows(result)) == [("P1", "P1", 1.0, 3), ("P2", "P9", 2.0, 4)]
+    assert head_as_pandas(result, 1).shape == (1, 4)
+
+
+def test_fetch_query_result_handles_no_rows():
+    cursor = _FakeCursor(None, ["PROPERTY_ID", "SCORE"])
+    result = fetch_query_result(_FakeSession(cursor), "SELECT 1")
+
+    assert cursor.closed
+    assert result["num_rows"] == 0
+    assert result["columns"] == ["PROPERTY_ID", "SCORE"]
+    assert result["numeric_cols"] == []
+
+
+def test_fetch_query_result_returns_fetched_table():
+    table = _sample_table()
+    cursor = _FakeCursor(table, table.column_names)
+    result = fetch_query_result(_FakeSession(cursor), "SELECT 1")
+
+    assert cursor.closed
+    assert result["table"] is table
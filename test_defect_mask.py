@@ -0,0 +1,124 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from defect_mask import (
+    DEFECT_BITS,
+    DEFECT_LABELS,
+    DEFECT_SEVERITY,
+    MASK_LIMIT,
+    decode_mask,
+    encode_labels,
+    room_severity_scores,
+    score_masks,
+)
+
+DDL_PATH = os.path.join(os.path.dirname(__file__), "table_ddls.sql")
+
+
+def flatten_severity_scores(
+    df: pd.DataFrame,
+    keys=("PROPERTY_ID", "ROOM_NAME"),
+    mask_col: str = "DEFECT_MASK",
+) -> pd.DataFrame:
+    """
+    Reference scorer with the old SQL shape: one row per label, dedupe
+    per room, then join against the weights table and sum.
+    """
+    keys = list(keys)
+    df = df[df[mask_col].notna()]
+    flat = df.loc[df.index.repeat(len(DEFECT_LABELS)), keys].reset_index(drop=True)
+    bits = np.tile(np.arange(len(DEFECT_LABELS)), len(df))
+    masks = np.repeat(df[mask_col].to_numpy().astype(np.int64), len(DEFECT_LABELS))
+    is_set = (masks >> bits) & 1 == 1
+    flat = flat[is_set].copy()
+    flat["DEFECT"] = np.array(DEFECT_LABELS, dtype=object)[bits[is_set]]
+    flat = flat.drop_duplicates(keys + ["DEFECT"])
+    weights = pd.DataFrame(list(DEFECT_SEVERITY.items()), columns=["DEFECT", "SEVERITY"])
+    return (
+        flat.merge(weights, on="DEFECT")
+        # SQL GROUP BY keeps NULL keys as their own group
+        .groupby(keys, as_index=False, dropna=False)["SEVERITY"].sum()
+        .rename(columns={"SEVERITY": "RAW_SEVERITY_SCORE"})
+    )
+
+
+def _sql_function_body(name: str) -> str:
+    with open(DDL_PATH) as f:
+        ddl = f.read()
+    match = re.search(rf"FUNCTION {name}\(.*?\$\$(.*?)\$\$", ddl, re.S)
+    assert match, f"{name} not found in table_ddls.sql"
+    return match.group(1)
+
+
+def test_every_mask_scores_sum_of_its_label_weights():
+    for mask in range(MASK_LIMIT):
+        expected = sum(DEFECT_SEVERITY[label] for label in decode_mask(mask))
+        assert score_masks([mask])[0] == expected
+
+
+def test_encode_decode_round_trip():
+    for mask in range(MASK_LIMIT):
+        assert encode_labels(decode_mask(mask)) == mask
+    assert encode_labels(["Crack", " LEAK ", "unknown"]) == DEFECT_BITS["crack"] | DEFECT_BITS["leak"]
+    assert encode_labels(None) == 0
+
+
+@pytest.mark.parametrize("bad_mask", [-1, MASK_LIMIT])
+def test_score_masks_rejects_out_of_range(bad_mask):
+    with pytest.raises(ValueError):
+        score_masks([1, bad_mask])
+
+
+def test_room_scores_match_flatten_dedupe_join():
+    rng = np.random.default_rng(0)
+    num_rows = 2_000
+    room_ids = rng.integers(0, 150, num_rows)
+    df = pd.DataFrame({
+        "PROPERTY_ID": [f"PROP-{i // 5}" for i in room_ids],
+        "ROOM_NAME": [f"Room {i % 5}" for i in room_ids],
+        "DEFECT_MASK": rng.integers(0, MASK_LIMIT, num_rows).astype(float),
+    })
+    df.loc[::97, "DEFECT_MASK"] = np.nan
+    df.loc[::53, "PROPERTY_ID"] = None
+    df.loc[::71, "ROOM_NAME"] = None
+
+    keys = ["PROPERTY_ID", "ROOM_NAME"]
+    scores = room_severity_scores(df).sort_values(keys).reset_index(drop=True)
+    baseline = flatten_severity_scores(df).sort_values(keys).reset_index(drop=True)
+    assert scores["PROPERTY_ID"].isna().any() and scores["ROOM_NAME"].isna().any()
+
+    pd.testing.assert_frame_equal(
+        scores[keys + ["RAW_SEVERITY_SCORE"]],
+        baseline,
+        check_dtype=False,
+    )
+
+
+def test_rooms_with_no_labels_are_dropped():
+    df = pd.DataFrame({
+        "PROPERTY_ID": ["a", "a", "b", "c"],
+        "ROOM_NAME": ["Kitchen", "Kitchen", "Kitchen", "Kitchen"],
+        "DEFECT_MASK": [1, 8, 0, DEFECT_BITS["no damage"]],
+    })
+    scores = room_severity_scores(df)
+    assert scores["PROPERTY_ID"].tolist() == ["a", "c"]
+    assert scores["RAW_SEVERITY_SCORE"].tolist() == [8, 0]
+
+
+def test_sql_defect_mask_bits_match_python():
+    body = _sql_function_body("DEFECT_MASK")
+    sql_bits = dict(re.findall(r"ARRAY_CONTAINS\('([^']+)'::VARIANT, .*\), (\d+), 0\)", body))
+    assert {label: int(bit) for label, bit in sql_bits.items()} == DEFECT_BITS
+    assert body.count("LOWER(") == len(DEFECT_LABELS)
+    assert "SELECT" not in body.upper()
+
+
+def test_sql_severity_weights_match_python():
+    body = _sql_function_body("DEFECT_MASK_SEVERITY")
+    sql_weights = {int(bit): int(w) for bit, w in re.findall(r"BITAND\(mask, (\d+)\) <> 0, (\d+), 0\)", body)}
+    for label in DEFECT_LABELS:
+        assert sql_weights.get(DEFECT_BITS[label], 0) == DEFECT_SEVERITY[label], label